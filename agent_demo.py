@@ -11,18 +11,23 @@ This demo shows:
 - Results reporting
 
 Usage:
-    python agent_demo.py [--mock] [--file <filename>]
+    python agent_demo.py [--mock] [--file <filename> | --all] [--demo-pause]
 """
 
 import argparse
+import copy
+import functools
 import os
 import sys
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from analyzers import PY_RE, RE_RETURN_HINT, RE_TYPE_ALIAS, read_source, scan
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -34,9 +39,21 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+def colorize(text: str, color: str = '') -> str:
+    """Wrap text in ANSI color codes."""
+    return f"{color}{text}{Colors.ENDC}"
+
 def print_colored(text: str, color: str = '') -> None:
     """Print colored text to terminal."""
-    print(f"{color}{text}{Colors.ENDC}")
+    print(colorize(text, color))
+
+# Colored banners printed on every call, built once
+_RULE = colorize("━" * 50, Colors.CYAN)
+_RESULTS_BANNER = "\n".join([
+    colorize("\n" + "=" * 50, Colors.HEADER),
+    colorize("✅ Task Complete!", Colors.GREEN),
+    colorize("=" * 50 + "\n", Colors.HEADER),
+])
 
 @dataclass
 class TaskStep:
@@ -54,19 +71,37 @@ class CodeAnalyzer:
     def analyze_file(self, filepath: str) -> Dict[str, Any]:
         """Analyze a Python file and return findings."""
         print_colored(f"\n📁 Analyzing: {filepath}", Colors.CYAN)
-        print_colored("━" * 50, Colors.CYAN)
-        
+        print(_RULE)
+        return self._analyze_path(filepath)
+    
+    def analyze_files(self, filepaths: List[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Analyze several files on a thread pool, returning findings in input order.
+
+        Only the file reads overlap; the regex scans hold the GIL.
+        """
+        # Workers don't print; output from several threads would interleave
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._analyze_path, filepaths))
+    
+    def _analyze_path(self, filepath: str) -> Dict[str, Any]:
+        """Analyze a file without printing, returning findings or an error."""
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
+            stat_result = os.stat(filepath)
+            findings = self._analyze_cached(filepath, stat_result.st_mtime_ns, stat_result.st_size, self.use_mock)
         except FileNotFoundError:
             return {"error": f"File not found: {filepath}"}
         except Exception as e:
             return {"error": str(e)}
         
-        # Analyze the code
-        findings = self._perform_analysis(content, filepath)
-        return findings
+        # Callers get their own copy so they can't modify the cached result
+        return copy.deepcopy(findings)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _analyze_cached(filepath: str, mtime_ns: int, size: int, use_mock: bool) -> Dict[str, Any]:
+        """Read and analyze a file, memoized on its path, mtime and size."""
+        content = read_source(filepath)
+        return CodeAnalyzer(use_mock)._perform_analysis(content, filepath)
     
     def _perform_analysis(self, content: str, filepath: str) -> Dict[str, Any]:
         """Perform actual code analysis."""
@@ -79,36 +114,38 @@ class CodeAnalyzer:
         """Mock analysis using rule-based detection."""
         issues = []
         suggestions = []
+        
+        # Single pass over the source, shared with the web UI's analyzer
+        counts, todos = scan(PY_RE, content)
+        
         stats = {
-            "lines": len(content.split('\n')),
-            "functions": len(re.findall(r'def\s+(\w+)', content)),
-            "classes": len(re.findall(r'class\s+(\w+)', content)),
-            "imports": len(re.findall(r'^import\s+|^from\s+', content, re.MULTILINE))
+            "lines": content.count('\n') + 1,
+            "functions": counts['func'],
+            "classes": counts['cls'],
+            "imports": counts['imp']
         }
         
         # Check for common issues
-        if 'print(' in content and 'logging not in content:
-'            issues.append("Using print() instead of proper logging")
+        if counts['print'] and not counts['logging']:
+            issues.append("Using print() instead of proper logging")
             suggestions.append("Consider using the logging module for production code")
         
-        if 'except:' in content:
+        if counts['bare']:
             issues.append("Bare except clause found")
             suggestions.append("Use specific exception types: except ValueError as e:")
         
-        if 'global ' in content:
+        if counts['glob']:
             issues.append("Using global variables")
             suggestions.append("Consider passing variables as parameters or using classes")
         
-        if not re.search(r'type\s+\w+\s*=\s*', content) and not re.search(r'def\s+\w+.*\)->', content):
-            if stats['functions'] > 0:
+        # Only run the backtracking type-hint searches when there are functions
+        if stats['functions'] > 0:
+            if not RE_TYPE_ALIAS.search(content) and not RE_RETURN_HINT.search(content):
                 suggestions.append("Consider adding type hints for better code clarity")
         
-        if len(content.split('\n')) > 100:
+        if stats['lines'] > 100:
             suggestions.append("File is quite long - consider splitting into modules")
         
-        # Check for TODOs
-        todos = re.findall(r'#\s*TODO:?\s*(.+)', content, re.IGNORECASE)
-        
         return {
             "filepath": filepath,
             "stats": stats,
@@ -143,9 +180,44 @@ class CodeAnalyzer:
 class AICodingAgent:
     """A simple AI coding agent that demonstrates autonomous coding."""
     
-    def __init__(self, name: str = "Agent", use_mock: bool = True):
+    # Step templates for each kind of task
+    _REVIEW_STEPS = (
+        TaskStep(1, "Read and parse the source file"),
+        TaskStep(2, "Identify code patterns and structure"),
+        TaskStep(3, "Detect potential issues and bugs"),
+        TaskStep(4, "Generate improvement suggestions"),
+    )
+    _FIX_STEPS = (
+        TaskStep(1, "Read the source file"),
+        TaskStep(2, "Identify bugs and issues"),
+        TaskStep(3, "Generate fix suggestions"),
+        TaskStep(4, "Apply fixes to code"),
+    )
+    _DOCS_STEPS = (
+        TaskStep(1, "Read source code"),
+        TaskStep(2, "Extract function signatures and docstrings"),
+        TaskStep(3, "Generate documentation"),
+    )
+    # Default generic task
+    _DEFAULT_STEPS = (
+        TaskStep(1, "Analyze the target"),
+        TaskStep(2, "Process the request"),
+        TaskStep(3, "Generate output"),
+    )
+    # Task keyword -> steps, checked in order
+    _PLANS: Dict[str, Tuple[TaskStep, ...]] = {
+        "analyze": _REVIEW_STEPS,
+        "review": _REVIEW_STEPS,
+        "fix": _FIX_STEPS,
+        "bug": _FIX_STEPS,
+        "document": _DOCS_STEPS,
+        "docs": _DOCS_STEPS,
+    }
+    
+    def __init__(self, name: str = "Agent", use_mock: bool = True, demo_pause: bool = False):
         self.name = name
         self.use_mock = use_mock
+        self.demo_pause = demo_pause
         self.analyzer = CodeAnalyzer(use_mock)
         
     def execute_task(self, task: str, target: str) -> Dict[str, Any]:
@@ -163,9 +235,8 @@ class AICodingAgent:
             print_colored(f"\n⚡ Executing step {step.step_id}: {step.description}", Colors.BLUE)
             step.status = "executing"
             
-            # Simulate work
-            import time
-            time.sleep(0.3)  # Brief pause for effect
+            if self.demo_pause:
+                time.sleep(0.3)  # Brief pause for effect
             
             result = self._execute_step(step, target)
             step.status = "completed"
@@ -188,35 +259,15 @@ class AICodingAgent:
         """Plan the task by breaking it into steps."""
         print_colored("\n📋 Planning task...", Colors.CYAN)
         
-        steps = []
+        t = task.lower()
+        templates = self._DEFAULT_STEPS
+        for keyword, plan in self._PLANS.items():
+            if keyword in t:
+                templates = plan
+                break
         
-        if "analyze" in task.lower() or "review" in task.lower():
-            steps = [
-                TaskStep(1, "Read and parse the source file"),
-                TaskStep(2, "Identify code patterns and structure"),
-                TaskStep(3, "Detect potential issues and bugs"),
-                TaskStep(4, "Generate improvement suggestions"),
-            ]
-        elif "fix" in task.lower() or "bug" in task.lower():
-            steps = [
-                TaskStep(1, "Read the source file"),
-                TaskStep(2, "Identify bugs and issues"),
-                TaskStep(3, "Generate fix suggestions"),
-                TaskStep(4, "Apply fixes to code"),
-            ]
-        elif "document" in task.lower() or "docs" in task.lower():
-            steps = [
-                TaskStep(1, "Read source code"),
-                TaskStep(2, "Extract function signatures and docstrings"),
-                TaskStep(3, "Generate documentation"),
-            ]
-        else:
-            # Default generic task
-            steps = [
-                TaskStep(1, "Analyze the target"),
-                TaskStep(2, "Process the request"),
-                TaskStep(3, "Generate output"),
-            ]
+        # Hand out copies; execute_task updates each step's status
+        steps = [copy.copy(step) for step in templates]
         
         for step in steps:
             print_colored(f"  → {step.step_id}. {step.description}", Colors.BLUE)
@@ -241,42 +292,67 @@ class AICodingAgent:
         return f"Task '{task}' completed successfully with {len(results)} steps executed."
 
 
+def _findings_lines(result: Dict[str, Any]) -> List[str]:
+    """Format the stats, issues, suggestions and TODOs of one analysis."""
+    buf = []
+    
+    if result.get('stats'):
+        buf.append(colorize("\n📈 Code Statistics:", Colors.CYAN))
+        buf.extend(f"  • {key}: {value}" for key, value in result['stats'].items())
+    
+    if result.get('issues'):
+        buf.append(colorize("\n🚨 Issues Found:", Colors.RED))
+        buf.extend(f"  ❌ {issue}" for issue in result['issues'])
+    
+    if result.get('suggestions'):
+        buf.append(colorize("\n💡 Suggestions:", Colors.YELLOW))
+        buf.extend(f"  💡 {suggestion}" for suggestion in result['suggestions'])
+    
+    if result.get('todos'):
+        buf.append(colorize("\n📌 TODOs:", Colors.BLUE))
+        buf.extend(f"  ☑️ {todo}" for todo in result['todos'])
+    
+    return buf
+
+
 def print_results(results: Dict[str, Any]) -> None:
     """Print the task results in a nice format."""
-    print_colored("\n" + "=" * 50, Colors.HEADER)
-    print_colored("✅ Task Complete!", Colors.GREEN)
-    print_colored("=" * 50 + "\n", Colors.HEADER)
+    # Collect every line and write them out in one go
+    buf = [_RESULTS_BANNER]
     
-    # Print summary
-    print_colored("📝 Summary:", Colors.BOLD)
-    print(f"  {results['summary']}\n")
+    # Summary
+    buf.append(colorize("📝 Summary:", Colors.BOLD))
+    buf.append(f"  {results['summary']}\n")
     
     # Print detailed results if analysis was done
     for i, result in enumerate(results['results']):
         if isinstance(result, dict) and 'issues' in result:
-            print_colored(f"\n📊 Analysis Results (Step {i+1}):", Colors.BOLD)
-            
-            if result.get('stats'):
-                print_colored("\n📈 Code Statistics:", Colors.CYAN)
-                for key, value in result['stats'].items():
-                    print(f"  • {key}: {value}")
-            
-            if result.get('issues'):
-                print_colored("\n🚨 Issues Found:", Colors.RED)
-                for issue in result['issues']:
-                    print(f"  ❌ {issue}")
-            
-            if result.get('suggestions'):
-                print_colored("\n💡 Suggestions:", Colors.YELLOW)
-                for suggestion in result['suggestions']:
-                    print(f"  💡 {suggestion}")
-            
-            if result.get('todos'):
-                print_colored("\n📌 TODOs:", Colors.BLUE)
-                for todo in result['todos']:
-                    print(f"  ☑️ {todo}")
+            buf.append(colorize(f"\n📊 Analysis Results (Step {i+1}):", Colors.BOLD))
+            buf.extend(_findings_lines(result))
     
-    print()
+    buf.append("\n")
+    sys.stdout.write("\n".join(buf))
+    sys.stdout.flush()
+
+
+def print_file_results(summary: str, filepaths: List[str], findings: List[Dict[str, Any]]) -> None:
+    """Print per-file findings from CodeAnalyzer.analyze_files."""
+    buf = [_RESULTS_BANNER]
+    
+    buf.append(colorize("📝 Summary:", Colors.BOLD))
+    buf.append(f"  {summary}\n")
+    
+    for filepath, result in zip(filepaths, findings):
+        buf.append(colorize(f"\n📁 {filepath}", Colors.CYAN))
+        buf.append(_RULE)
+        if result.get('error'):
+            buf.append(colorize(f"  ❌ Error: {result['error']}", Colors.RED))
+        else:
+            buf.extend(_findings_lines(result))
+    
+    buf.append("\n")
+    sys.stdout.write("\n".join(buf))
+    sys.stdout.flush()
 
 
 def main():
@@ -288,6 +364,10 @@ def main():
                         help="File to analyze")
     parser.add_argument('--task', type=str, default='analyze',
                         help="Task to perform (analyze, fix, document)")
+    parser.add_argument('--demo-pause', action='store_true',
+                        help="Pause briefly between steps for effect")
+    parser.add_argument('--all', action='store_true',
+                        help="Analyze every Python file in demo_files/")
     
     args = parser.parse_args()
     
@@ -301,6 +381,14 @@ def main():
     
     # Get the demo files directory
     demo_dir = Path(__file__).parent / "demo_files"
+    
+    if args.all:
+        analyzer = CodeAnalyzer(use_mock=args.mock)
+        files = sorted(str(f) for f in demo_dir.glob("*.py"))
+        findings = analyzer.analyze_files(files)
+        print_file_results(f"Analyzed {len(files)} file(s) in {demo_dir}", files, findings)
+        return
+    
     target_file = demo_dir / args.file.replace("demo_files/", "")
     
     if not target_file.exists():
@@ -315,7 +403,8 @@ def main():
         sys.exit(1)
     
     # Create the agent
-    agent = AICodingAgent(name="CodeAnalyzer Agent", use_mock=args.mock)
+    agent = AICodingAgent(name="CodeAnalyzer Agent", use_mock=args.mock,
+                          demo_pause=args.demo_pause)
     
     # Execute the task
     results = agent.execute_task(
@@ -331,7 +420,8 @@ def main():
     
     # Document task
     print_colored("📄 Task: Generate Documentation", Colors.CYAN)
-    agent2 = AICodingAgent(name="DocAgent", use_mock=args.mock)
+    agent2 = AICodingAgent(name="DocAgent", use_mock=args.mock,
+                           demo_pause=args.demo_pause)
     results2 = agent2.execute_task("document", str(target_file))
     print_results(results2)
 
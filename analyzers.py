@@ -0,0 +1,160 @@
+"""
+Rule-based Code Analyzers
+=========================
+Lightweight Python and JavaScript analyzers behind the web UI's
+rule-based (mock) mode and the CLI's CodeAnalyzer. No Streamlit
+dependency, so they can be imported and reused anywhere; scan() and the
+precompiled patterns are shared with the other analyzers.
+"""
+
+import re
+
+# Single-pass scanners for the rule-based analyzers. The lookaheads keep
+# names and TODO text unconsumed so tokens inside them (e.g. "def
+# setup_logging") are still seen.
+PY_RE = re.compile(
+    r'(?P<todo>#\s*(?i:TODO):?\s*(?=(?P<todo_text>.+)))'
+    r'|(?P<func>def(?=\s+(?P<func_name>\w+)))'
+    r'|(?P<cls>class(?=\s+(?P<cls_name>\w+)))'
+    r'|(?P<imp>^(?:import|from)\s)'
+    r'|(?P<print>print\()'
+    r'|(?P<logging>logging)'
+    r'|(?P<bare>except:)'
+    r'|(?P<glob>global )',
+    re.MULTILINE
+)
+RE_TYPE_ALIAS = re.compile(r'type\s+\w+\s*=\s*')
+RE_RETURN_HINT = re.compile(r'def\s+\w+.*\)->')
+JS_RE = re.compile(
+    r'(?P<todo>//\s*(?i:TODO):?\s*(?=(?P<todo_text>.+)))'
+    r'|(?P<func>(?:function|const(?=\s+\w+\s*=\s*(?:async\s*)?\())(?=\s+(?P<func_name>\w+)))'
+    r'|(?P<imp>^(?:import\s|const(?=\s+\w+\s*=\s*require)))'
+    r'|(?P<cls>class(?=\s+(?P<cls_name>\w+)))'
+    r'|(?P<console>console\.log)'
+    r'|(?P<var>var )'
+    r'|(?P<loose>[=!]=)'
+    r'|(?P<eval>eval\()'
+    r'|(?P<inner>innerHTML)',
+    re.MULTILINE
+)
+
+
+def scan(pattern: re.Pattern, code: str) -> tuple:
+    """Run one finditer pass, returning (counts by group name, TODO texts)."""
+    counts = dict.fromkeys(pattern.groupindex, 0)
+    todos = []
+    seen = {}
+    # Group holding each kind's unconsumed name, looked up once per call
+    name_groups = {
+        kind: pattern.groupindex[f'{kind}_name']
+        for kind in pattern.groupindex if f'{kind}_name' in pattern.groupindex
+    }
+    for match in pattern.finditer(code):
+        kind = match.lastgroup
+        # A match inside an earlier same-kind name or TODO text is part of it
+        if match.start() < seen.get(kind, 0):
+            continue
+        if kind == 'todo':
+            todos.append(match.group('todo_text'))
+            seen[kind] = match.end('todo_text')
+        else:
+            counts[kind] += 1
+            if kind in name_groups:
+                seen[kind] = match.end(name_groups[kind])
+    return counts, todos
+
+
+def read_source(path: str) -> str:
+    """Read a UTF-8 source file with text-mode newline handling."""
+    # Unbuffered raw read skips the text I/O layer; decode in one go
+    with open(path, 'rb', buffering=0) as f:
+        content = f.read().decode('utf-8')
+    
+    # Same newline handling as text mode
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def analyze_python_mock(code: str) -> dict:
+    """Analyze Python code (mock/rule-based)."""
+    issues = []
+    suggestions = []
+    counts, todos = scan(PY_RE, code)
+    lines = code.count('\n') + 1
+    
+    # Check for common issues
+    if counts['print'] and not counts['logging']:
+        issues.append("Using print() instead of proper logging")
+        suggestions.append("Consider using the logging module for production code")
+    
+    if counts['bare']:
+        issues.append("Bare except clause found")
+        suggestions.append("Use specific exception types: except ValueError as e:")
+    
+    if counts['glob']:
+        issues.append("Using global variables")
+        suggestions.append("Consider passing variables as parameters or using classes")
+    
+    # Only run the backtracking type-hint searches when there are functions
+    if counts['func'] > 0:
+        if not RE_TYPE_ALIAS.search(code) and not RE_RETURN_HINT.search(code):
+            suggestions.append("Consider adding type hints for better code clarity")
+    
+    if lines > 100:
+        suggestions.append("File is quite long - consider splitting into modules")
+    
+    stats = {
+        "lines": lines,
+        "functions": counts['func'],
+        "classes": counts['cls'],
+        "imports": counts['imp']
+    }
+    
+    return {
+        "stats": stats,
+        "issues": issues,
+        "suggestions": suggestions,
+        "todos": todos
+    }
+
+
+def analyze_javascript_mock(code: str) -> dict:
+    """Analyze JavaScript code (mock/rule-based)."""
+    issues = []
+    suggestions = []
+    counts, todos = scan(JS_RE, code)
+    
+    stats = {
+        "lines": code.count('\n') + 1,
+        "functions": counts['func'],
+        "classes": counts['cls'],
+        "imports": counts['imp'],
+    }
+    
+    if counts['console']:
+        issues.append("Using console.log for debugging")
+        suggestions.append("Use a proper logging library or remove in production")
+    
+    if counts['var']:
+        issues.append("Using 'var' instead of 'let' or 'const'")
+        suggestions.append("Use 'let' for mutable variables, 'const' for immutable")
+    
+    if counts['loose']:
+        issues.append("Using loose equality (==/!=)")
+        suggestions.append("Use strict equality (===/!==) for predictable comparisons")
+    
+    if counts['eval']:
+        issues.append("⚠️ SECURITY: Using eval() is dangerous")
+        suggestions.append("Avoid eval() - it can execute arbitrary code")
+    
+    if counts['inner']:
+        issues.append("⚠️ Potential XSS: Using innerHTML")
+        suggestions.append("Use textContent or sanitize input")
+    
+    return {
+        "stats": stats,
+        "issues": issues,
+        "suggestions": suggestions,
+        "todos": todos
+    }
@@ -6,6 +6,7 @@ A simple web interface for analyzing and fixing buggy code
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from pathlib import Path
 
@@ -17,40 +18,37 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-<style>
-    .main {
-        background-color: #0e1117;
-    }
-    .stTextArea textarea {
-        background-color: #1e2128;
-        color: #e6e6e6;
-    }
-    .bug-highlight {
-        padding: 10px;
-        border-radius: 5px;
-        margin: 5px 0;
-    }
-    .bug-critical { border-left: 4px solid #ff4b4b; background: #2d1a1a; }
-    .bug-warning { border-left: 4px solid #ffa500; background: #2d2617; }
-    .bug-info { border-left: 4px solid #4b9eff; background: #172d47; }
-    .fix-success { border-left: 4px solid #4bff4b; background: #1a2d1a; padding: 15px; border-radius: 5px; }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the custom stylesheet once per process."""
+    css = (Path(__file__).parent / "static" / "style.css").read_text()
+    return f"<style>\n{css}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+@st.cache_data
+def load_demo_file(name: str) -> str:
+    """Read a file from demo_files/, or "" if it doesn't exist."""
+    demo_file = Path(__file__).parent / "demo_files" / name
+    if demo_file.exists():
+        return demo_file.read_text()
+    return ""
 
 # Sidebar
 st.sidebar.title("🤖 AI Code Fixer")
 st.sidebar.markdown("---")
 
 # Initialize session state
-if "code" not in st.session_state:
-    st.session_state.code = ""
-if "analysis" not in st.session_state:
-    st.session_state.analysis = None
-if "fixed_code" not in st.session_state:
-    st.session_state.fixed_code = None
-if "language" not in st.session_state:
-    st.session_state.language = "Python"
+DEFAULT_STATE = {"code": "", "analysis": None, "fixed_code": None, "language": "Python"}
+for key, value in DEFAULT_STATE.items():
+    st.session_state.setdefault(key, value)
+if "http" not in st.session_state:
+    # Keep-alive session so analyze/fix calls reuse the TLS connection
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    st.session_state.http = session
 
 # Language selector
 language = st.sidebar.selectbox(
@@ -78,24 +76,16 @@ model = st.sidebar.text_input(
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📁 Demo Files")
 if st.sidebar.button("Load buggy_calculator.py"):
-    demo_file = Path(__file__).parent / "demo_files" / "buggy_calculator.py"
-    if demo_file.exists():
-        st.session_state.code = demo_file.read_text()
+    demo_code = load_demo_file("buggy_calculator.py")
+    if demo_code:
+        st.session_state.code = demo_code
         st.session_state.language = "Python"
 if st.sidebar.button("Load sample_code.py"):
-    demo_file = Path(__file__).parent / "demo_files" / "sample_code.py"
-    if demo_file.exists():
-        st.session_state.code = demo_file.read_text()
+    demo_code = load_demo_file("sample_code.py")
+    if demo_code:
+        st.session_state.code = demo_code
         st.session_state.language = "Python"
 
-# Initialize session state
-if "code" not in st.session_state:
-    st.session_state.code = ""
-if "analysis" not in st.session_state:
-    st.session_state.analysis = None
-if "fixed_code" not in st.session_state:
-    st.session_state.fixed_code = None
-
 # Main UI
 st.title("🤖 AI Code Fixer")
 st.markdown("**Upload or paste your code, and let AI find and fix the bugs!**")
@@ -191,7 +181,7 @@ Provide your analysis in this format:
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.3
         }
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = st.session_state.http.post(url, headers=headers, json=data, timeout=30)
         response.raise_for_status()
         return {"success": response.json()["choices"][0]["message"]["content"]}
     except Exception as e:
@@ -225,7 +215,7 @@ Fixed code:"""
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.2
         }
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = st.session_state.http.post(url, headers=headers, json=data, timeout=30)
         response.raise_for_status()
         return {"success": response.json()["choices"][0]["message"]["content"]}
     except Exception as e:
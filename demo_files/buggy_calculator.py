@@ -40,23 +40,23 @@ class Calculator:
         return a % b
 
 
+# Operator -> Calculator method, built once at import
+_OPS = {
+    '+': Calculator.add,
+    '-': Calculator.subtract,
+    '*': Calculator.multiply,
+    '/': Calculator.divide,
+    '**': Calculator.power,
+    '%': Calculator.modulo,
+}
+
+
 def calculate(operator, a, b):
     """Calculate based on operator."""
-    calc = Calculator()
-    
     # Bug: No validation of operator
-    if operator == '+':
-        return calc.add(a, b)
-    elif operator == '-':
-        return calc.subtract(a, b)
-    elif operator == '*':
-        return calc.multiply(a, b)
-    elif operator == '/':
-        return calc.divide(a, b)
-    elif operator == '**':
-        return calc.power(a, b)
-    elif operator == '%':
-        return calc.modulo(a, b)
+    method = _OPS.get(operator)
+    if method is not None:
+        return method(Calculator(), a, b)
 
 
 # Main - with bugs
@@ -41,21 +41,13 @@ class DataProcessor:
     
     def process(self):
         # Missing return type hint
-        processed = []
-        for item in self.data:
-            if type(item) == str:
-                processed.append(item.upper())
-            else:
-                processed.append(item)
-        return processed
+        return [item.upper() if isinstance(item, str) else item for item in self.data]
 
 
 def calculate_stats(numbers):
     """Calculate statistics."""
     # No input validation
-    total = 0
-    for num in numbers:
-        total = total + num
+    total = sum(numbers)
     
     avg = total / len(numbers)  # Could fail if empty
     
@@ -7,6 +7,28 @@ Analyzes JavaScript/TypeScript code for common issues and improvements.
 import re
 from typing import Dict, Any, List
 
+from analyzers import read_source, scan
+
+# Precompiled patterns for the rule-based analyzer.
+# _RE_TOKENS counts the stats and the literal needles in one scan() pass;
+# the TODO text itself is collected separately by _RE_TODO.
+_RE_TOKENS = re.compile(
+    r'(?P<func>(?:function|const(?=\s+\w+\s*=\s*(?:async\s*)?\())(?=\s+(?P<func_name>\w+)))'
+    r'|(?P<imp>^(?:import\s|const(?=\s+\w+\s*=\s*require)))'
+    r'|(?P<export>^export\s)'
+    r'|(?P<cls>class(?=\s+(?P<cls_name>\w+)))'
+    r'|(?P<console>console\.log)'
+    r'|(?P<var>var )'
+    r'|(?P<loose>[=!]=)'
+    r'|(?P<any>any)'
+    r'|(?P<todo_marker>TODO)'
+    r'|(?P<await>await)'
+    r'|(?P<eval>eval\()'
+    r'|(?P<inner>innerHTML)',
+    re.MULTILINE
+)
+_RE_TODO = re.compile(r'//\s*(?i:TODO):?\s*(.+)')
+_RE_ASYNC = re.compile(r'async\s+function|const\s+\w+\s*=\s*async')
 
 class JavaScriptAnalyzer:
     """Analyzes JavaScript/TypeScript code for issues and improvements."""
@@ -20,8 +42,7 @@ class JavaScriptAnalyzer:
         print("━" * 50)
         
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
+            content = read_source(filepath)
         except FileNotFoundError:
             return {"error": f"File not found: {filepath}"}
         except Exception as e:
@@ -34,43 +55,45 @@ class JavaScriptAnalyzer:
         issues = []
         suggestions = []
         
-        # Count stats
+        # Count everything in one pass; no per-pattern match lists
+        counts, _ = scan(_RE_TOKENS, content)
+        
         stats = {
-            "lines": len(content.split('\n')),
-            "functions": len(re.findall(r'function\s+(\w+)|const\s+(\w+)\s*=\s*(?:async\s*)?\(', content)),
-            "classes": len(re.findall(r'class\s+(\w+)', content)),
-            "imports": len(re.findall(r'^import\s+|^const\s+\w+\s*=\s*require', content, re.MULTILINE)),
-            "exports": len(re.findall(r'^export\s+', content, re.MULTILINE)),
+            "lines": content.count('\n') + 1,
+            "functions": counts['func'],
+            "classes": counts['cls'],
+            "imports": counts['imp'],
+            "exports": counts['export'],
         }
         
         # Check for common JS issues
-        if 'console.log' in content:
+        if counts['console']:
             issues.append("Using console.log for debugging")
             suggestions.append("Use a proper logging library or remove in production")
         
-        if 'var ' in content:
+        if counts['var']:
             issues.append("Using 'var' instead of 'let' or 'const'")
             suggestions.append("Use 'let' for mutable variables, 'const' for immutable")
         
-        if '==' in content or '!=' in content:
+        if counts['loose']:
             issues.append("Using loose equality (==/!=)")
             suggestions.append("Use strict equality (===/!==) for predictable comparisons")
         
-        if 'any' in content and '.ts' in filepath:
+        if counts['any'] and '.ts' in filepath:
             suggestions.append("Consider adding specific types instead of 'any'")
         
-        if 'TODO' in content:
-            todos = re.findall(r'//\s*TODO:?\s*(.+)', content, re.IGNORECASE)
+        if counts['todo_marker']:
+            todos = _RE_TODO.findall(content)
         
-        if not re.search(r'async\s+function|const\s+\w+\s*=\s*async', content) and 'await' in content:
+        if counts['await'] and not _RE_ASYNC.search(content):
             issues.append("Using 'await' without 'async' function")
         
         # Check for common security issues
-        if 'eval(' in content:
+        if counts['eval']:
             issues.append("⚠️ SECURITY: Using eval() is dangerous")
             suggestions.append("Avoid eval() - it can execute arbitrary code")
         
-        if 'innerHTML' in content:
+        if counts['inner']:
             issues.append("⚠️ Potential XSS: Using innerHTML")
             suggestions.append("Use textContent or sanitize input")
         
@@ -0,0 +1,87 @@
+"""
+Tests for the single-pass scanners in analyzers.py.
+
+Each case is checked against the separate findall passes the scanners
+replaced, so names and TODO text left in lookaheads can't be re-counted.
+
+Run with: python -m unittest test_analyzers
+"""
+
+import re
+import unittest
+
+from analyzers import JS_RE, PY_RE, scan
+
+
+def findall_python(code: str) -> tuple:
+    """Counts and TODOs the way the per-pattern findall code produced them."""
+    counts = {
+        "func": len(re.findall(r'def\s+(\w+)', code)),
+        "cls": len(re.findall(r'class\s+(\w+)', code)),
+        "imp": len(re.findall(r'^import\s+|^from\s+', code, re.MULTILINE)),
+    }
+    return counts, re.findall(r'#\s*TODO:?\s*(.+)', code, re.IGNORECASE)
+
+
+def findall_javascript(code: str) -> tuple:
+    """Counts and TODOs the way the per-pattern findall code produced them."""
+    counts = {
+        "func": len(re.findall(r'function\s+(\w+)|const\s+(\w+)\s*=\s*(?:async\s*)?\(', code)),
+        "cls": len(re.findall(r'class\s+(\w+)', code)),
+        "imp": len(re.findall(r'^import\s+|^const\s+\w+\s*=\s*require', code, re.MULTILINE)),
+        "loose": int('==' in code or '!=' in code),
+    }
+    return counts, re.findall(r'//\s*TODO:?\s*(.+)', code, re.IGNORECASE)
+
+
+PY_CASES = [
+    "def def f(): pass",
+    "def undefined_x(): pass",
+    "# TODO a # todo b",
+    "# TODO: drop this # todo marker\n# todo: next",
+    "class Cclass C: pass\nclass class D: pass",
+    "import os\nfrom sys import path\n# TODO import more",
+    "def setup_logging(): print('x')  # TODO: use logging",
+    "# TODO\n# TODO: second line",
+]
+
+JS_CASES = [
+    "function const a = () => 1;",
+    "// TODO: x == y",
+    "// TODO a // todo b",
+    "class class C {}",
+    "const f = async (x) => x;\nfunction function g() {}",
+    "const fs = require('fs');\nimport x from 'y';",
+    "// TODO\n// TODO: second line",
+]
+
+
+class ScanTests(unittest.TestCase):
+
+    def assert_matches(self, pattern, reference, code):
+        counts, todos = scan(pattern, code)
+        expected_counts, expected_todos = reference(code)
+        for kind, expected in expected_counts.items():
+            actual = counts[kind] if kind != "loose" else int(counts[kind] > 0)
+            self.assertEqual(actual, expected, f"{kind} in {code!r}")
+        self.assertEqual(todos, expected_todos, f"todos in {code!r}")
+
+    def test_python_matches_findall(self):
+        for code in PY_CASES:
+            with self.subTest(code=code):
+                self.assert_matches(PY_RE, findall_python, code)
+
+    def test_javascript_matches_findall(self):
+        for code in JS_CASES:
+            with self.subTest(code=code):
+                self.assert_matches(JS_RE, findall_javascript, code)
+
+    def test_tokens_inside_names_and_todos_still_counted(self):
+        counts, todos = scan(PY_RE, "def setup_logging():\n    pass  # TODO: print(x)")
+        self.assertEqual(counts['logging'], 1)
+        self.assertEqual(counts['print'], 1)
+        self.assertEqual(todos, ["print(x)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,11 +9,21 @@ Supports local Ollama for AI-powered analysis!
 """
 
 import streamlit as st
-import re
 import json
 import requests
-from pathlib import Path
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List
+
+import analyzers
+
+try:
+    # Faster parsing of Ollama's streamed JSON lines when available
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # Page config
 st.set_page_config(
@@ -25,19 +35,35 @@ st.set_page_config(
 # Ollama configuration
 OLLAMA_BASE_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.2"
+# Uploaded files analyzed at once; Ollama serves up to OLLAMA_NUM_PARALLEL
+MAX_PARALLEL_ANALYSES = 4
+# (connect, read) timeouts for generation: fail fast if Ollama is unreachable,
+# but give the model time between streamed chunks
+GENERATE_TIMEOUT = (2, 120)
+# How long Ollama keeps a model loaded after the last request
+KEEP_ALIVE = "30m"
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Keep-alive session for all Ollama requests, shared across reruns and sessions."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    return session
 
+@st.cache_data(ttl=10, show_spinner=False)
 def check_ollama_available() -> bool:
     """Check if Ollama is running."""
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=2)
+        response = get_http_session().get(f"{OLLAMA_BASE_URL}/api/tags", timeout=2)
         return response.status_code == 200
     except:
         return False
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_available_models() -> list:
     """Get list of available Ollama models."""
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=2)
+        response = get_http_session().get(f"{OLLAMA_BASE_URL}/api/tags", timeout=2)
         if response.status_code == 200:
             data = response.json()
             return [m["name"] for m in data.get("models", [])]
@@ -45,6 +71,23 @@ def get_available_models() -> list:
         pass
     return []
 
+def warm_model(model: str) -> None:
+    """Load a model in the background so the first analysis doesn't wait for it."""
+    session = get_http_session()
+    
+    def load():
+        try:
+            # An empty prompt just loads the model and keeps it resident
+            session.post(
+                f"{OLLAMA_BASE_URL}/api/generate",
+                json={"model": model, "prompt": "", "keep_alive": KEEP_ALIVE, "stream": False},
+                timeout=GENERATE_TIMEOUT
+            )
+        except requests.RequestException:
+            pass  # Best effort; analysis loads the model anyway
+    
+    threading.Thread(target=load, daemon=True).start()
+
 def analyze_with_ollama(code: str, language: str, model: str) -> dict:
     """Analyze code using local Ollama."""
     
@@ -68,115 +111,110 @@ Code to analyze:
 Respond ONLY with valid JSON:"""
 
     try:
-        response = requests.post(
+        with get_http_session().post(
             f"{OLLAMA_BASE_URL}/api/generate",
             json={
                 "model": model,
                 "prompt": prompt,
-                "stream": False,
-                "format": "json"
+                "stream": True,
+                "format": "json",
+                "keep_alive": KEEP_ALIVE
             },
-            timeout=120
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            analysis = json.loads(result.get("response", "{}"))
-            return {
-                "issues": analysis.get("issues", []),
-                "suggestions": analysis.get("suggestions", []),
-                "security": analysis.get("security", []),
-                "quality": analysis.get("quality", []),
-                "raw": result.get("response", "")
-            }
+            timeout=GENERATE_TIMEOUT,
+            stream=True
+        ) as response:
+            if response.status_code == 200:
+                # Collect the streamed chunks as the model generates them
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json_loads(line)
+                    if "error" in chunk:
+                        return {"error": chunk["error"]}
+                    parts.append(chunk.get("response", ""))
+                    if chunk.get("done"):
+                        break
+                
+                raw = "".join(parts)
+                if not raw:
+                    return {"error": "Model returned an empty response"}
+                try:
+                    analysis = json_loads(raw)
+                except json.JSONDecodeError:
+                    return {"error": "Model returned non-JSON", "raw": raw}
+                if not isinstance(analysis, dict):
+                    return {"error": "Model returned JSON that is not an object", "raw": raw}
+                return {
+                    "issues": analysis.get("issues", []),
+                    "suggestions": analysis.get("suggestions", []),
+                    "security": analysis.get("security", []),
+                    "quality": analysis.get("quality", []),
+                    "raw": raw
+                }
     except Exception as e:
         return {"error": str(e)}
     
     return {"error": "Failed to get response from Ollama"}
 
 
-def analyze_python_mock(code: str) -> dict:
-    """Analyze Python code (mock/rule-based)."""
-    issues = []
-    suggestions = []
-    
-    # Check for common issues
-    if 'print(' in code and 'logging' not in code:
-        issues.append("Using print() instead of proper logging")
-        suggestions.append("Consider using the logging module for production code")
-    
-    if 'except:' in code:
-        issues.append("Bare except clause found")
-        suggestions.append("Use specific exception types: except ValueError as e:")
-    
-    if 'global ' in code:
-        issues.append("Using global variables")
-        suggestions.append("Consider passing variables as parameters or using classes")
-    
-    if not re.search(r'type\s+\w+\s*=\s*', code) and not re.search(r'def\s+\w+.*\)->', code):
-        if len(re.findall(r'def\s+(\w+)', code)) > 0:
-            suggestions.append("Consider adding type hints for better code clarity")
-    
-    if len(code.split('\n')) > 100:
-        suggestions.append("File is quite long - consider splitting into modules")
-    
-    todos = re.findall(r'#\s*TODO:?\s*(.+)', code, re.IGNORECASE)
-    
-    stats = {
-        "lines": len(code.split('\n')),
-        "functions": len(re.findall(r'def\s+(\w+)', code)),
-        "classes": len(re.findall(r'class\s+(\w+)', code)),
-        "imports": len(re.findall(r'^import\s+|^from\s+', code, re.MULTILINE))
-    }
-    
-    return {
-        "stats": stats,
-        "issues": issues,
-        "suggestions": suggestions,
-        "todos": todos
-    }
-
-
-def analyze_javascript_mock(code: str) -> dict:
-    """Analyze JavaScript code (mock/rule-based)."""
-    issues = []
-    suggestions = []
-    
-    stats = {
-        "lines": len(code.split('\n')),
-        "functions": len(re.findall(r'function\s+(\w+)|const\s+(\w+)\s*=\s*(?:async\s*)?\(', code)),
-        "classes": len(re.findall(r'class\s+(\w+)', code)),
-        "imports": len(re.findall(r'^import\s+|^const\s+\w+\s*=\s*require', code, re.MULTILINE)),
-    }
-    
-    if 'console.log' in code:
-        issues.append("Using console.log for debugging")
-        suggestions.append("Use a proper logging library or remove in production")
-    
-    if 'var ' in code:
-        issues.append("Using 'var' instead of 'let' or 'const'")
-        suggestions.append("Use 'let' for mutable variables, 'const' for immutable")
-    
-    if '==' in code or '!=' in code:
-        issues.append("Using loose equality (==/!=)")
-        suggestions.append("Use strict equality (===/!==) for predictable comparisons")
-    
-    if 'eval(' in code:
-        issues.append("⚠️ SECURITY: Using eval() is dangerous")
-        suggestions.append("Avoid eval() - it can execute arbitrary code")
+class AnalysisError(Exception):
+    """A failed analysis result, raised so st.cache_data doesn't store it."""
     
-    if 'innerHTML' in code:
-        issues.append("⚠️ Potential XSS: Using innerHTML")
-        suggestions.append("Use textContent or sanitize input")
-    
-    todos = re.findall(r'//\s*TODO:?\s*(.+)', code, re.IGNORECASE)
-    
-    return {
-        "stats": stats,
-        "issues": issues,
-        "suggestions": suggestions,
-        "todos": todos
-    }
+    def __init__(self, result: dict):
+        super().__init__(result["error"])
+        self.result = result
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def cached_ollama_analysis(code: str, language: str, model: str) -> dict:
+    """analyze_with_ollama, memoized on (code, language, model).
+    
+    Errors are raised instead of returned so they aren't cached.
+    """
+    result = analyze_with_ollama(code, language, model)
+    if "error" in result:
+        raise AnalysisError(result)
+    return result
+
+
+def run_analysis(code: str, language: str, use_ollama: bool, model: str) -> dict:
+    """Analyze code with Ollama or the rule-based analyzers, reusing cached results."""
+    if use_ollama:
+        try:
+            return cached_ollama_analysis(code, language, model)
+        except AnalysisError as e:
+            return e.result
+    elif language == "Python":
+        return analyze_python_mock(code)
+    else:
+        return analyze_javascript_mock(code)
+
+
+def analyze_many(codes: List[str], languages: List[str], use_ollama: bool, model: str) -> List[dict]:
+    """Analyze several inputs, each in its own language, overlapping the Ollama requests."""
+    if not use_ollama or len(codes) < 2:
+        return [run_analysis(code, language, use_ollama, model) for code, language in zip(codes, languages)]
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_ANALYSES) as executor:
+        return list(executor.map(lambda code, language: run_analysis(code, language, True, model), codes, languages))
+
+
+def language_for(filename: str, default: str) -> str:
+    """Pick the analyzer language from a file's extension."""
+    if filename.endswith(".py"):
+        return "Python"
+    if filename.endswith((".js", ".ts", ".jsx", ".tsx")):
+        return "JavaScript"
+    return default
+
+
+# Rule-based analyzers, memoized across reruns
+analyze_python_mock = st.cache_data(ttl=3600, max_entries=128, show_spinner=False)(
+    analyzers.analyze_python_mock
+)
+analyze_javascript_mock = st.cache_data(ttl=3600, max_entries=128, show_spinner=False)(
+    analyzers.analyze_javascript_mock
+)
 
 
 def main():
@@ -210,8 +248,17 @@ def main():
                 models,
                 index=models.index(DEFAULT_MODEL) if DEFAULT_MODEL in models else 0
             )
+            # Start loading the model while the user is still typing
+            if st.session_state.get("_warmed_model") != selected_model:
+                st.session_state["_warmed_model"] = selected_model
+                warm_model(selected_model)
         else:
             st.sidebar.warning("No models found. Using default.")
+        st.sidebar.caption(
+            "Multiple uploaded files are sent to Ollama in parallel. "
+            "Set `OLLAMA_NUM_PARALLEL` on the Ollama server to let it process them concurrently, "
+            "and `OLLAMA_MAX_LOADED_MODELS` to keep more than one model resident."
+        )
     
     language = st.sidebar.selectbox(
         "Select Language",
@@ -239,49 +286,55 @@ def main():
         if st.button(button_label, type="primary"):
             if code_input:
                 with st.spinner("Analyzing..." + (" (AI)" if use_ollama else "") ):
-                    if use_ollama:
-                        result = analyze_with_ollama(code_input, language, selected_model)
-                    elif language == "Python":
-                        result = analyze_python_mock(code_input)
-                    else:
-                        result = analyze_javascript_mock(code_input)
-                    
+                    result = run_analysis(code_input, language, use_ollama, selected_model)
                     display_results(result, use_ollama)
             else:
                 st.warning("Please enter some code first!")
     
     with tab2:
-        uploaded_file = st.file_uploader(
-            "Choose a file",
+        uploaded_files = st.file_uploader(
+            "Choose files",
             type=["py", "js", "ts", "jsx", "tsx"],
+            accept_multiple_files=True,
             help="Upload Python or JavaScript/TypeScript files"
         )
         
-        if uploaded_file is not None:
-            code = uploaded_file.getvalue().decode("utf-8")
-            st.code(code, language=language.lower())
+        if uploaded_files:
+            codes = []
+            languages = []
+            for uploaded_file in uploaded_files:
+                # Decode straight from the upload buffer; bad bytes don't abort the page
+                code = uploaded_file.getvalue().decode("utf-8", errors="replace")
+                file_language = language_for(uploaded_file.name, language)
+                with st.expander(uploaded_file.name, expanded=False):
+                    st.code(code, language=file_language.lower())
+                codes.append(code)
+                languages.append(file_language)
             
-            button_label = "🔍 Analyze with Ollama" if use_ollama else "🔍 Analyze Uploaded File"
+            button_label = "🔍 Analyze with Ollama" if use_ollama else "🔍 Analyze Uploaded Files"
             
             if st.button(button_label, type="primary"):
                 with st.spinner("Analyzing..." + (" (AI)" if use_ollama else "")):
-                    if use_ollama:
-                        result = analyze_with_ollama(code, language, selected_model)
-                    elif language == "Python":
-                        result = analyze_python_mock(code)
-                    else:
-                        result = analyze_javascript_mock(code)
-                    
-                    display_results(result, use_ollama)
+                    results = analyze_many(codes, languages, use_ollama, selected_model)
+                for i, (uploaded_file, result) in enumerate(zip(uploaded_files, results)):
+                    display_results(result, use_ollama, label=uploaded_file.name, key=f"upload:{i}")
+
 
+def bullet_list(items: list, icon: str = "") -> str:
+    """Format items as a single markdown bullet list."""
+    return "\n".join(f"- {icon}{item}" for item in items)
 
-def display_results(result: dict, is_ollama: bool = False):
-    """Display analysis results."""
+
+def display_results(result: dict, is_ollama: bool = False, label: str = "", key: str = ""):
+    """Display analysis results, titled by label; key keeps widget IDs unique."""
     st.divider()
-    st.subheader("📊 Analysis Results")
+    st.subheader(f"📊 Analysis Results: {label}" if label else "📊 Analysis Results")
     
     if result.get("error"):
         st.error(f"Error: {result['error']}")
+        if result.get("raw"):
+            with st.expander("Raw AI response"):
+                st.text(result["raw"])
         return
     
     # For Ollama results
@@ -289,29 +342,25 @@ def display_results(result: dict, is_ollama: bool = False):
         # Issues
         if result.get("issues"):
             st.markdown("### 🚨 Issues Found")
-            for issue in result["issues"]:
-                st.warning(f"• {issue}")
+            st.warning(bullet_list(result["issues"]))
         
         # Suggestions
         if result.get("suggestions"):
             st.markdown("### 💡 Suggestions")
-            for suggestion in result["suggestions"]:
-                st.info(f"💡 {suggestion}")
+            st.info(bullet_list(result["suggestions"], "💡 "))
         
         # Security
         if result.get("security"):
             st.markdown("### 🔒 Security Concerns")
-            for sec in result["security"]:
-                st.error(f"🔒 {sec}")
+            st.error(bullet_list(result["security"], "🔒 "))
         
         # Quality
         if result.get("quality"):
             st.markdown("### 📊 Code Quality")
-            for q in result["quality"]:
-                st.write(f"• {q}")
+            st.markdown(bullet_list(result["quality"]))
         
         # Show raw if needed
-        if st.checkbox("Show raw AI response"):
+        if st.checkbox("Show raw AI response", key=f"{key}:raw"):
             st.text(result.get("raw", ""))
     
     # For mock/rule-based results
@@ -319,30 +368,28 @@ def display_results(result: dict, is_ollama: bool = False):
         # Stats
         if result.get("stats"):
             st.markdown("### 📈 Code Statistics")
-            cols = st.columns(4)
-            for i, (key, value) in enumerate(result["stats"].items()):
-                cols[i % 4].metric(key.capitalize(), value)
+            st.table({"Value": {name.capitalize(): value for name, value in result["stats"].items()}})
         
-        # Issues
+        # Issues, with security warnings grouped separately
         if result.get("issues"):
             st.markdown("### 🚨 Issues Found")
-            for issue in result["issues"]:
-                if "⚠️" in issue:
-                    st.error(issue)
-                else:
-                    st.warning(issue)
+            warnings = [issue for issue in result["issues"] if "⚠️" in issue]
+            others = [issue for issue in result["issues"] if "⚠️" not in issue]
+            if warnings:
+                st.error(bullet_list(warnings))
+            if others:
+                st.warning(bullet_list(others))
         
         # Suggestions
         if result.get("suggestions"):
             st.markdown("### 💡 Suggestions")
-            for suggestion in result["suggestions"]:
-                st.info(f"💡 {suggestion}")
+            st.info(bullet_list(result["suggestions"], "💡 "))
         
         # TODOs
         if result.get("todos"):
             st.markdown("### 📌 TODOs")
-            for todo in result["todos"]:
-                st.checkbox(todo, value=False)
+            for i, todo in enumerate(result["todos"]):
+                st.checkbox(todo, value=False, key=f"{key}:todo:{i}")
     
     # Summary
     issue_count = len(result.get("issues", [])) + len(result.get("security", []))